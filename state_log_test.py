@@ -0,0 +1,13 @@
+import yt_to_twitter
+
+
+def test_torn_last_line_is_dropped_before_next_append(tmp_path, monkeypatch):
+    state_file = tmp_path / "processed_videos.log"
+    monkeypatch.setattr(yt_to_twitter, "STATE_FILE", str(state_file))
+    state_file.write_text("aaa\nbb")
+
+    processed = yt_to_twitter.load_processed_videos()
+    assert processed == {"aaa"}
+
+    yt_to_twitter.save_processed_video("ccc", processed)
+    assert yt_to_twitter.load_processed_videos() == {"aaa", "ccc"}
@@ -1,9 +1,17 @@
 import os
+import asyncio
+import glob
 import json
+import logging
+import re
 import sys
+import tempfile
 import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
 import googleapiclient.discovery
+import googleapiclient.errors
 import yt_dlp
 import tweepy
 from dotenv import load_dotenv
@@ -11,6 +19,8 @@ from dotenv import load_dotenv
 # Load .env file
 load_dotenv()
 
+log = logging.getLogger("yt2x")
+
 # --- CONFIGURATION ---
 # Load credentials from environment variables for security
 YOUTUBE_API_KEY = os.getenv("YOUTUBE_API_KEY")
@@ -23,81 +33,179 @@ TWITTER_ACCESS_TOKEN = os.getenv("TWITTER_ACCESS_TOKEN") or os.getenv("X_ACCESS_
 TWITTER_ACCESS_TOKEN_SECRET = os.getenv("TWITTER_ACCESS_TOKEN_SECRET") or os.getenv("X_ACCESS_SECRET")
 TWITTER_BEARER_TOKEN = os.getenv("TWITTER_BEARER_TOKEN") or os.getenv("X_BEARER_TOKEN")
 
-STATE_FILE = "processed_videos.json"
+# yt-dlp authentication: an exported cookies.txt, or cookies read from a local browser (e.g. "firefox")
+YTDLP_COOKIES_FILE = os.getenv("YTDLP_COOKIES_FILE", "cookies.txt")
+YTDLP_COOKIES_FROM_BROWSER = os.getenv("YTDLP_COOKIES_FROM_BROWSER")
+# Optional override of yt-dlp's cache directory (defaults to $XDG_CACHE_HOME/yt-dlp)
+YTDLP_CACHE_DIR = os.getenv("YTDLP_CACHE_DIR")
+
+# Append-only log of processed video ids, one per line
+STATE_FILE = "processed_videos.log"
+LEGACY_STATE_FILE = "processed_videos.json"
+STATE_COMPACT_SIZE = 1024 * 1024  # Rewrite the log without duplicates past 1 MiB
+
+# YouTube ISO 8601 duration, e.g. PT1H2M3S
+_DUR_RE = re.compile(r'PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?')
+
+# Downloads run ahead of uploads by at most DOWNLOAD_AHEAD finished files, which
+# bounds how many videos sit in DOWNLOAD_DIR (tmpfs is RAM) while uploads wait.
+# Uploads stay serial so tweets go out oldest first and within Twitter's posting limits.
+DOWNLOAD_AHEAD = 1
+UPLOAD_INTERVAL = 60  # Seconds between successful tweets (rate limit safety)
+
+# Chunked media upload: APPEND segments are sent in parallel, one chunk in memory per worker
+UPLOAD_CHUNK_SIZE = 4 * 1024 * 1024
+UPLOAD_CHUNK_WORKERS = 4
+
+# Downloads go to tmpfs when available so videos never touch persistent storage
+DOWNLOAD_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+
+# Shared yt-dlp options. Single pre-muxed mp4 file (no ffmpeg merge step), capped at
+# Twitter's 1080p limit; fragments of HLS/DASH formats are fetched in parallel.
+YDL_OPTS = {
+    'format': 'best[ext=mp4][height<=1080]/best[ext=mp4]/best',
+    'postprocessors': [],
+    'outtmpl': '%(id)s.mp4',
+    'paths': {'home': DOWNLOAD_DIR},
+    'quiet': True,
+    'no_warnings': True,
+    'concurrent_fragment_downloads': 4,
+}
+# Browser cookies replace the cookie file; setting both would dump them into it on close
+if YTDLP_COOKIES_FROM_BROWSER:
+    YDL_OPTS['cookiesfrombrowser'] = (YTDLP_COOKIES_FROM_BROWSER,)
+else:
+    YDL_OPTS['cookiefile'] = YTDLP_COOKIES_FILE
+if YTDLP_CACHE_DIR:
+    YDL_OPTS['cachedir'] = os.path.expanduser(YTDLP_CACHE_DIR)
+
+# Uploads playlist id per channel; it never changes for a channel
+_UPLOADS_ID_CACHE = {}
+
+# Last playlistItems response per (playlist, limit), revalidated with its ETag
+_PLAYLIST_CACHE = {}
 
 def load_processed_videos():
+    """
+    Reads the state log into a set. Migrates the legacy JSON state file on first run.
+    """
     if os.path.exists(STATE_FILE):
+        with open(STATE_FILE, "r") as f:
+            content = f.read()
+        lines = content.split()
+        # A crash mid-write leaves a partial last id without its newline; drop it and
+        # rewrite the log so the next append doesn't run into the torn line
+        torn = bool(content) and not content.endswith("\n")
+        if torn:
+            lines = lines[:-1]
+        processed = set(lines)
+        if torn or (len(lines) > len(processed) and os.path.getsize(STATE_FILE) > STATE_COMPACT_SIZE):
+            compact_processed_videos(processed)
+        return processed
+
+    if os.path.exists(LEGACY_STATE_FILE):
         try:
-            with open(STATE_FILE, "r") as f:
-                return set(json.load(f))
+            with open(LEGACY_STATE_FILE, "r") as f:
+                processed = set(json.load(f))
         except json.JSONDecodeError:
             return set()
+        compact_processed_videos(processed)
+        return processed
+
     return set()
 
+def compact_processed_videos(processed_set):
+    """
+    Rewrites the state log with one line per id, replacing the old file atomically.
+    """
+    tmp_file = STATE_FILE + ".tmp"
+    with open(tmp_file, "w") as f:
+        f.write("".join(f"{video_id}\n" for video_id in processed_set))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_file, STATE_FILE)
+
 def save_processed_video(video_id, processed_set):
     processed_set.add(video_id)
-    with open(STATE_FILE, "w") as f:
-        json.dump(list(processed_set), f)
+    with open(STATE_FILE, "a") as f:
+        f.write(video_id + "\n")
+        f.flush()
+        os.fsync(f.fileno())
 
 def parse_duration(duration_str):
     """
     Parses YouTube ISO 8601 duration string (e.g., PT1M, PT59S) to seconds.
     This is a simplified parser.
     """
-    import re
-    # Pattern to extract hours, minutes, seconds
-    pattern = re.compile(r'PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?')
-    match = pattern.match(duration_str)
+    match = _DUR_RE.match(duration_str)
     if not match:
         return 0
-    
+
     h, m, s = match.groups()
-    hours = int(h) if h else 0
-    minutes = int(m) if m else 0
-    seconds = int(s) if s else 0
-    
-    total_seconds = hours * 3600 + minutes * 60 + seconds
-    return total_seconds
+    return int(h or 0) * 3600 + int(m or 0) * 60 + int(s or 0)
 
-def get_latest_shorts(youtube, channel_id, limit=5):
+def get_latest_shorts(youtube, channel_id, processed, limit=5):
     """
     Fetches latest videos from the channel's uploads playlist and filters for Shorts (<= 60s).
+    Already processed videos are dropped before the video details request, which is skipped
+    entirely when nothing new was uploaded.
     """
     try:
-        # 1. Get Uploads Playlist ID
-        res = youtube.channels().list(id=channel_id, part="contentDetails").execute()
-        if not res["items"]:
-            print("Channel not found.")
-            return []
-        
-        uploads_playlist_id = res["items"][0]["contentDetails"]["relatedPlaylists"]["uploads"]
+        # 1. Get Uploads Playlist ID (fetched once per channel)
+        uploads_playlist_id = _UPLOADS_ID_CACHE.get(channel_id)
+        if uploads_playlist_id is None:
+            res = youtube.channels().list(id=channel_id, part="contentDetails").execute()
+            if not res["items"]:
+                log.warning("Channel not found.")
+                return []
+
+            uploads_playlist_id = res["items"][0]["contentDetails"]["relatedPlaylists"]["uploads"]
+            _UPLOADS_ID_CACHE[channel_id] = uploads_playlist_id
 
         # 2. Get recent videos from that playlist
-        playlist_items = youtube.playlistItems().list(
+        # Only download the list again if it changed since the last check (HTTP 304 otherwise)
+        request = youtube.playlistItems().list(
             playlistId=uploads_playlist_id,
             part="contentDetails",
+            fields="etag,items/contentDetails/videoId",
             maxResults=limit
-        ).execute()
+        )
+        cache_key = (uploads_playlist_id, limit)
+        cached = _PLAYLIST_CACHE.get(cache_key)
+        if cached and cached.get("etag"):
+            request.headers["If-None-Match"] = cached["etag"]
+        try:
+            playlist_items = request.execute()
+            _PLAYLIST_CACHE[cache_key] = playlist_items
+        except googleapiclient.errors.HttpError as e:
+            if not cached or e.resp.status != 304:
+                raise
+            playlist_items = cached
 
-        video_ids = [item["contentDetails"]["videoId"] for item in playlist_items.get("items", [])]
+        video_ids = [
+            item["contentDetails"]["videoId"]
+            for item in playlist_items.get("items", [])
+            if item["contentDetails"]["videoId"] not in processed
+        ]
         
         if not video_ids:
             return []
 
-        # 3. Get details for these videos to check duration
+        # 3. Get details for these videos to check duration (only the fields we use)
         vid_res = youtube.videos().list(
             id=",".join(video_ids),
-            part="snippet,contentDetails"
+            part="snippet,contentDetails",
+            fields="items(id,contentDetails/duration,snippet(title,description,publishedAt))"
         ).execute()
         
         shorts = []
         for item in vid_res.get("items", []):
+            vid_id = item["id"]
             duration_str = item["contentDetails"]["duration"]
             seconds = parse_duration(duration_str)
             title = item["snippet"]["title"]
             description = item["snippet"]["description"]
             published_at_str = item["snippet"]["publishedAt"]  # e.g., 2025-12-30T15:00:00Z
-            vid_id = item["id"]
             
             # --- DATE FILTERING ---
             # Parse publishedAt (UTC)
@@ -110,11 +218,11 @@ def get_latest_shorts(youtube, channel_id, limit=5):
                 age_hours = (now_utc - published_at).total_seconds() / 3600
                 
                 if age_hours > 24:
-                    print(f"Skipping '{title}' (Age: {age_hours:.1f}h) - Older than 24 hours.")
+                    log.info("Skipping '%s' (Age: %.1fh) - Older than 24 hours.", title, age_hours)
                     continue
                     
             except ValueError as ve:
-                print(f"Error parsing date for {vid_id}: {ve}")
+                log.warning("Error parsing date for %s: %s", vid_id, ve)
                 # If date parsing fails, we might skip or allow. Let's allow to be safe, or skip.
                 # Usually API is consistent.
                 pass
@@ -123,120 +231,233 @@ def get_latest_shorts(youtube, channel_id, limit=5):
             if seconds <= 180:
                 shorts.append({"id": vid_id, "title": title, "description": description})
             else:
-                print(f"Skipping '{title}' (Duration: {seconds}s) - longer than 180s.")
+                log.info("Skipping '%s' (Duration: %ss) - longer than 180s.", title, seconds)
                 
         return shorts
 
     except Exception as e:
-        print(f"Error fetching YouTube videos: {e}")
+        log.error("Error fetching YouTube videos: %s", e)
         return []
 
-def download_video(video_id):
+@contextmanager
+def _local_file(file_path):
+    """
+    Yields the path of a downloaded file and deletes the file on exit.
+    """
+    try:
+        yield file_path
+    finally:
+        # Cleanup CRITICAL STEP
+        try:
+            os.unlink(file_path)
+            log.info("Deleted local file: %s", file_path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            log.error("Error deleting local file %s: %s", file_path, e)
+
+def _discard(video_file):
+    """
+    Deletes a downloaded video that will not be uploaded.
+    """
+    with video_file:
+        pass
+
+def download_video(video_id, ydl):
+    """
+    Downloads a video into DOWNLOAD_DIR with a YoutubeDL instance shared across the check.
+    Returns a context manager yielding the file path and removing the file on exit, or None on failure.
+    """
     url = f"https://www.youtube.com/watch?v={video_id}"
-    output_filename = f"{video_id}.mp4"
-    
-    # Best video+audio that is mp4. 
-    # For Shorts, usually 'best' is fine, but we ensure mp4 container.
-    # Add oauth2 to fix bot detection
-    ydl_opts = {
-        'format': 'bestvideo[ext=mp4]+bestaudio[ext=m4a]/best[ext=mp4]/best',
-        'outtmpl': output_filename,
-        'quiet': True,
-        'no_warnings': True,
-        'username': 'oauth2', 
-        'password': '' # This will prompt for code, but since we are headless we might need a cache.
-    }
-    # REVISION: Interactive oauth2 doesn't work well headless without cache.
-    # Better approach: Try to use 'ios' client or just ignore the error if it's transient, 
-    # but the error is persistent.
-    # We will try adding 'extractor_args' to force a specific client that might be less restricted.
-    ydl_opts = {
-        'format': 'best[ext=mp4]/best', # Try single best file first to avoid complex merging issues if ffmpeg is missing
-        'outtmpl': output_filename,
-        'quiet': True,
-        'no_warnings': True,
-        'cookiefile': 'cookies.txt',  # Reverting to cookies.txt
-    }
-    
+    output_filename = os.path.join(DOWNLOAD_DIR, f"{video_id}.mp4")
+
     try:
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            print(f"Downloading {video_id}...")
-            ydl.download([url])
+        log.info("Downloading %s...", video_id)
+        ydl.download([url])
         
         if os.path.exists(output_filename):
-            return output_filename
+            return _local_file(output_filename)
     except Exception as e:
-        print(f"Error downloading video: {e}")
+        log.error("Error downloading video: %s", e)
+
+    # yt-dlp leaves .part/fragment files behind on failure; they would sit in tmpfs (RAM) for good
+    for partial_file in glob.glob(glob.escape(output_filename) + ".*"):
+        try:
+            os.unlink(partial_file)
+        except OSError as e:
+            log.error("Error deleting partial download %s: %s", partial_file, e)
     
     return None
 
-def upload_to_twitter(video_path, text, client_v2, auth_v1):
+def _append_chunk(api_v1, media_id, video_path, segment_index):
+    with open(video_path, "rb") as f:
+        f.seek(segment_index * UPLOAD_CHUNK_SIZE)
+        chunk = f.read(UPLOAD_CHUNK_SIZE)
+    api_v1.chunked_upload_append(media_id, chunk, segment_index)
+
+def upload_media(api_v1, video_path):
+    """
+    Uploads a video with chunked INIT/APPEND/FINALIZE, sending APPEND segments in parallel.
+    Waits for Twitter's async processing to finish before returning the media.
+    """
+    total_bytes = os.path.getsize(video_path)
+    media = api_v1.chunked_upload_init(total_bytes, "video/mp4", media_category="tweet_video")
+    media_id = media.media_id
+
+    segment_count = -(-total_bytes // UPLOAD_CHUNK_SIZE)
+    with ThreadPoolExecutor(max_workers=UPLOAD_CHUNK_WORKERS) as pool:
+        futures = [
+            pool.submit(_append_chunk, api_v1, media_id, video_path, segment_index)
+            for segment_index in range(segment_count)
+        ]
+        for future in futures:
+            future.result()
+
+    media = api_v1.chunked_upload_finalize(media_id)
+    processing_info = getattr(media, "processing_info", None)
+    while processing_info and processing_info["state"] in ("pending", "in_progress"):
+        time.sleep(processing_info.get("check_after_secs", 5))
+        media = api_v1.get_media_upload_status(media_id)
+        processing_info = getattr(media, "processing_info", None)
+
+    if processing_info and processing_info["state"] == "failed":
+        raise tweepy.TweepyException(f"Media processing failed: {processing_info.get('error')}")
+    return media
+
+def upload_to_twitter(video_path, text, client_v2, api_v1):
     try:
-        print("Uploading media to Twitter...")
+        log.info("Uploading media to Twitter...")
         # Media upload still requires v1.1 API
-        api_v1 = tweepy.API(auth_v1)
-        media = api_v1.media_upload(video_path)
+        media = upload_media(api_v1, video_path)
         
-        print("Posting tweet...")
+        log.info("Posting tweet...")
         # Create Tweet with v2 Client
         client_v2.create_tweet(text=text, media_ids=[media.media_id])
-        print("Tweet posted successfully!")
+        log.info("Tweet posted successfully!")
         return True
     except Exception as e:
-        print(f"Error uploading to Twitter: {e}")
+        log.error("Error uploading to Twitter: %s", e)
         return False
 
-def run_check(youtube, client_v2, auth_v1, processed):
+def setup_logging():
+    """
+    Sends log records to stdout (captured by run_monitor.sh) with timestamps.
+    """
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s", stream=sys.stdout)
+
+class RateLimiter:
+    """
+    Enforces a minimum interval between actions using a monotonic deadline.
+    """
+    def __init__(self, interval):
+        self.interval = interval
+        self.next_allowed = time.monotonic()
+
+    async def acquire(self):
+        delay = self.next_allowed - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def mark_used(self):
+        self.next_allowed = time.monotonic() + self.interval
+
+# Spaces out successful tweets; persists across checks
+upload_limiter = RateLimiter(UPLOAD_INTERVAL)
+
+async def publish_video(video, video_file, client_v2, api_v1, processed):
+    """
+    Tweets a downloaded video, removes the local file and records the video as processed.
+    """
+    # Construct Tweet Text with Description
+    tweet_text = f"{video['title']}\n\n{video['description']}"
+
+    # Truncate to 4000 characters (for verified accounts)
+    if len(tweet_text) > 4000:
+        tweet_text = tweet_text[:3997] + "..."
+
+    # Upload (waits for the previous tweet's rate limit window to pass)
+    with video_file as file_path:
+        await upload_limiter.acquire()
+        success = await asyncio.to_thread(upload_to_twitter, file_path, tweet_text, client_v2, api_v1)
+
+    if success:
+        upload_limiter.mark_used()
+        save_processed_video(video["id"], processed)
+        log.info("Processed %s.", video["id"])
+    else:
+        log.warning("Failed to upload %s. Will try again next run.", video["id"])
+
+    return success
+
+async def run_check(youtube, client_v2, api_v1, processed):
     """
     Performs a single check for new videos and processes them.
+    The next video is downloaded while the previous one is uploaded.
     """
     try:
-        new_videos = get_latest_shorts(youtube, YOUTUBE_CHANNEL_ID)
-        
+        new_videos = await asyncio.to_thread(get_latest_shorts, youtube, YOUTUBE_CHANNEL_ID, processed)
+
         # Reverse order to post oldest new video first if multiple
-        for video in reversed(new_videos):
-            if video["id"] in processed:
-                continue
-                
-            print(f"Found new video: {video['title']} ({video['id']})")
-            
-            # Download
-            file_path = download_video(video["id"])
-            
-            if file_path:
-                # Construct Tweet Text with Description
-                tweet_text = f"{video['title']}\n\n{video['description']}"
-                
-                # Truncate to 4000 characters (for verified accounts)
-                if len(tweet_text) > 4000:
-                    tweet_text = tweet_text[:3997] + "..."
+        pending = list(reversed(new_videos))
+        if not pending:
+            return
+
+        downloaded = asyncio.Queue(maxsize=DOWNLOAD_AHEAD)
+
+        # One YoutubeDL for the whole check; downloads run one at a time so it is never
+        # used concurrently. Closing it writes refreshed cookies back to the cookie file.
+        with yt_dlp.YoutubeDL(YDL_OPTS) as ydl:
+
+            async def download_stage():
+                try:
+                    for video in pending:
+                        log.info("Found new video: %s (%s)", video["title"], video["id"])
+                        download = asyncio.ensure_future(asyncio.to_thread(download_video, video["id"], ydl))
+                        try:
+                            video_file = await asyncio.shield(download)
+                        except asyncio.CancelledError:
+                            # The download thread can't be interrupted; remove its file once it finishes
+                            video_file = await download
+                            if video_file:
+                                _discard(video_file)
+                            raise
+                        if video_file:
+                            try:
+                                await downloaded.put((video, video_file))
+                            except asyncio.CancelledError:
+                                _discard(video_file)
+                                raise
+                except Exception as e:
+                    log.error("Error downloading videos: %s", e)
+                await downloaded.put(None)
+
+            downloader = asyncio.create_task(download_stage())
+            try:
+                while True:
+                    item = await downloaded.get()
+                    if item is None:
+                        break
+                    video, video_file = item
+                    await publish_video(video, video_file, client_v2, api_v1, processed)
+            finally:
+                # Stop downloading and delete videos that were downloaded but never uploaded
+                downloader.cancel()
+                await asyncio.gather(downloader, return_exceptions=True)
+                while not downloaded.empty():
+                    item = downloaded.get_nowait()
+                    if item is not None:
+                        _discard(item[1])
 
-                # Upload
-                success = upload_to_twitter(file_path, tweet_text, client_v2, auth_v1)
-                
-                # Cleanup CRITICAL STEP
-                if os.path.exists(file_path):
-                    try:
-                        os.remove(file_path)
-                        print(f"Deleted local file: {file_path}")
-                    except OSError as e:
-                        print(f"Error checking file after deletion: {e}")
-                
-                if success:
-                    save_processed_video(video["id"], processed)
-                    print(f"Processed {video['id']}. Waiting 60s before next (if any)...")
-                    time.sleep(60) # Rate limit safety
-                else:
-                    print(f"Failed to upload {video['id']}. Will try again next run.")
-                    
     except Exception as e:
-        print(f"Error during check cycle: {e}")
+        log.error("Error during check cycle: %s", e)
 
 def main():
+    setup_logging()
+
     # 1. Validate Env Vars
     if not all([YOUTUBE_API_KEY, YOUTUBE_CHANNEL_ID, TWITTER_CONSUMER_KEY, 
                 TWITTER_CONSUMER_SECRET, TWITTER_ACCESS_TOKEN, TWITTER_ACCESS_TOKEN_SECRET]):
-        print("Error: Missing environment variables. Please check your configuration.")
+        log.error("Missing environment variables. Please check your configuration.")
         sys.exit(1)
 
     # 2. Setup Clients
@@ -245,12 +466,17 @@ def main():
     try:
         import pytz
     except ImportError:
-        print("Error: pytz module is missing. Please run 'pip install pytz'")
+        log.error("pytz module is missing. Please run 'pip install pytz'")
         sys.exit(1)
 
-    print("Starting YouTube Monitor (Daily 10:00 - 19:00 TR time)...")
+    log.info("Starting YouTube Monitor (Daily 10:00 - 19:00 TR time)...")
     
-    youtube = googleapiclient.discovery.build("youtube", "v3", developerKey=YOUTUBE_API_KEY)
+    # The discovery document bundled with google-api-python-client is used (no network fetch)
+    youtube = googleapiclient.discovery.build(
+        "youtube", "v3",
+        developerKey=YOUTUBE_API_KEY,
+        static_discovery=True
+    )
     
     client_v2 = tweepy.Client(
         consumer_key=TWITTER_CONSUMER_KEY,
@@ -263,6 +489,8 @@ def main():
         TWITTER_CONSUMER_KEY, TWITTER_CONSUMER_SECRET,
         TWITTER_ACCESS_TOKEN, TWITTER_ACCESS_TOKEN_SECRET
     )
+    # Media upload still requires v1.1 API
+    api_v1 = tweepy.API(auth_v1)
 
     tz_tr = pytz.timezone("Europe/Istanbul")
 
@@ -272,18 +500,18 @@ def main():
         
         # Check if within 10:00 to 19:00 TR Time
         if 10 <= current_hour <= 19:
-            print(f"[{now.strftime('%Y-%m-%d %H:%M:%S')}] Time is within window. Running check...")
+            log.info("Time is within window. Running check...")
             
             # Load state fresh each time to be safe
             processed = load_processed_videos()
-            run_check(youtube, client_v2, auth_v1, processed)
+            asyncio.run(run_check(youtube, client_v2, api_v1, processed))
             
-            print("Check complete. Sleeping for 1 hour...")
+            log.info("Check complete. Sleeping for 1 hour...")
             time.sleep(3600)
             
         else:
             # Calculate time until next 10:00
-            print(f"[{now.strftime('%Y-%m-%d %H:%M:%S')}] Outside operating hours (10-19). Sleeping until next start time...")
+            log.info("Outside operating hours (10-19). Sleeping until next start time...")
             
             # Logic to find next 10am
             next_start = now.replace(hour=10, minute=0, second=0, microsecond=0)
@@ -297,7 +525,7 @@ def main():
                 next_start = now.replace(hour=10, minute=0, second=0, microsecond=0)
                 
             seconds_to_sleep = (next_start - now).total_seconds()
-            print(f"Sleeping for {seconds_to_sleep/3600:.2f} hours (until {next_start.strftime('%Y-%m-%d %H:%M:%S')})...")
+            log.info("Sleeping for %.2f hours (until %s)...", seconds_to_sleep / 3600, next_start.strftime('%Y-%m-%d %H:%M:%S'))
             
             # Only sleep if positive, just in case
             if seconds_to_sleep > 0:
@@ -1,202 +1,44 @@
-import os
-import json
 import sys
-import time
-from datetime import datetime
 import googleapiclient.discovery
-import yt_dlp
 import tweepy
-from dotenv import load_dotenv
-
-# Load .env file
-load_dotenv()
-
-# --- CONFIGURATION ---
-# Load credentials from environment variables for security
-YOUTUBE_API_KEY = os.getenv("YOUTUBE_API_KEY")
-YOUTUBE_CHANNEL_ID = os.getenv("YOUTUBE_CHANNEL_ID")
-
-# Support both naming conventions (TWITTER_ or X_)
-TWITTER_CONSUMER_KEY = os.getenv("TWITTER_CONSUMER_KEY") or os.getenv("X_API_KEY")
-TWITTER_CONSUMER_SECRET = os.getenv("TWITTER_CONSUMER_SECRET") or os.getenv("X_API_SECRET")
-TWITTER_ACCESS_TOKEN = os.getenv("TWITTER_ACCESS_TOKEN") or os.getenv("X_ACCESS_TOKEN")
-TWITTER_ACCESS_TOKEN_SECRET = os.getenv("TWITTER_ACCESS_TOKEN_SECRET") or os.getenv("X_ACCESS_SECRET")
-TWITTER_BEARER_TOKEN = os.getenv("TWITTER_BEARER_TOKEN") or os.getenv("X_BEARER_TOKEN")
-
-STATE_FILE = "processed_videos.json"
-
-def load_processed_videos():
-    if os.path.exists(STATE_FILE):
-        try:
-            with open(STATE_FILE, "r") as f:
-                return set(json.load(f))
-        except json.JSONDecodeError:
-            return set()
-    return set()
-
-def save_processed_video(video_id, processed_set):
-    processed_set.add(video_id)
-    with open(STATE_FILE, "w") as f:
-        json.dump(list(processed_set), f)
-
-def parse_duration(duration_str):
-    """
-    Parses YouTube ISO 8601 duration string (e.g., PT1M, PT59S) to seconds.
-    This is a simplified parser.
-    """
-    import re
-    # Pattern to extract hours, minutes, seconds
-    pattern = re.compile(r'PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?')
-    match = pattern.match(duration_str)
-    if not match:
-        return 0
-    
-    h, m, s = match.groups()
-    hours = int(h) if h else 0
-    minutes = int(m) if m else 0
-    seconds = int(s) if s else 0
-    
-    total_seconds = hours * 3600 + minutes * 60 + seconds
-    return total_seconds
-
-def get_latest_shorts(youtube, channel_id, limit=5):
-    """
-    Fetches latest videos from the channel's uploads playlist and filters for Shorts (<= 60s).
-    """
-    try:
-        # 1. Get Uploads Playlist ID
-        res = youtube.channels().list(id=channel_id, part="contentDetails").execute()
-        if not res["items"]:
-            print("Channel not found.")
-            return []
-        
-        uploads_playlist_id = res["items"][0]["contentDetails"]["relatedPlaylists"]["uploads"]
-
-        # 2. Get recent videos from that playlist
-        playlist_items = youtube.playlistItems().list(
-            playlistId=uploads_playlist_id,
-            part="contentDetails",
-            maxResults=limit
-        ).execute()
-
-        video_ids = [item["contentDetails"]["videoId"] for item in playlist_items.get("items", [])]
-        
-        if not video_ids:
-            return []
-
-        # 3. Get details for these videos to check duration
-        vid_res = youtube.videos().list(
-            id=",".join(video_ids),
-            part="snippet,contentDetails"
-        ).execute()
-        
-        shorts = []
-        for item in vid_res.get("items", []):
-            duration_str = item["contentDetails"]["duration"]
-            seconds = parse_duration(duration_str)
-            title = item["snippet"]["title"]
-            description = item["snippet"]["description"]
-            published_at_str = item["snippet"]["publishedAt"]
-            vid_id = item["id"]
-            
-            # --- DATE FILTERING ---
-            try:
-                published_at = datetime.strptime(published_at_str, "%Y-%m-%dT%H:%M:%SZ")
-                now_utc = datetime.utcnow()
-                age_hours = (now_utc - published_at).total_seconds() / 3600
-                
-                if age_hours > 24:
-                    print(f"Skipping '{title}' (Age: {age_hours:.1f}h) - Older than 24 hours.")
-                    continue
-            except ValueError:
-                pass
-
-            # Filter: <= 180 seconds (3 minutes)
-            if seconds <= 180:
-                shorts.append({"id": vid_id, "title": title, "description": description})
-            else:
-                print(f"Skipping '{title}' (Duration: {seconds}s) - longer than 180s.")
-                
-        return shorts
-
-    except Exception as e:
-        print(f"Error fetching YouTube videos: {e}")
-        return []
-
-def download_video(video_id):
-    url = f"https://www.youtube.com/watch?v={video_id}"
-    output_filename = f"{video_id}.mp4"
-    
-    # Best video+audio that is mp4. 
-    # For Shorts, usually 'best' is fine, but we ensure mp4 container.
-    # Add oauth2 to fix bot detection
-    ydl_opts = {
-        'format': 'bestvideo[ext=mp4]+bestaudio[ext=m4a]/best[ext=mp4]/best',
-        'outtmpl': output_filename,
-        'quiet': True,
-        'no_warnings': True,
-        'username': 'oauth2', 
-        'password': '' # This will prompt for code, but since we are headless we might need a cache.
-    }
-    # REVISION: Interactive oauth2 doesn't work well headless without cache.
-    # Better approach: Try to use 'ios' client or just ignore the error if it's transient, 
-    # but the error is persistent.
-    # We will try adding 'extractor_args' to force a specific client that might be less restricted.
-    ydl_opts = {
-        'format': 'best[ext=mp4]/best', # Try single best file first to avoid complex merging issues if ffmpeg is missing
-        'outtmpl': output_filename,
-        'quiet': True,
-        'no_warnings': True,
-        'cookiefile': 'cookies.txt',  # Reverting to cookies.txt as OAuth2 is deprecated
-    }
-    
-    try:
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            print(f"Downloading {video_id}...")
-            ydl.download([url])
-        
-        if os.path.exists(output_filename):
-            return output_filename
-    except Exception as e:
-        print(f"Error downloading video: {e}")
-    
-    return None
-
-def upload_to_twitter(video_path, text, client_v2, auth_v1):
-    try:
-        print("Uploading media to Twitter...")
-        # Media upload still requires v1.1 API
-        api_v1 = tweepy.API(auth_v1)
-        media = api_v1.media_upload(video_path)
-        
-        print("Posting tweet...")
-        # Create Tweet with v2 Client
-        client_v2.create_tweet(text=text, media_ids=[media.media_id])
-        print("Tweet posted successfully!")
-        return True
-    except Exception as e:
-        print(f"Error uploading to Twitter: {e}")
-        return False
+import yt_dlp
 
-def run_check(youtube, client_v2, auth_v1, processed):
+# Single-shot test run of the monitor: shares configuration, state handling and
+# the YouTube/Twitter helpers with yt_to_twitter.py so both see the same state log.
+from yt_to_twitter import (
+    YOUTUBE_API_KEY,
+    YOUTUBE_CHANNEL_ID,
+    TWITTER_CONSUMER_KEY,
+    TWITTER_CONSUMER_SECRET,
+    TWITTER_ACCESS_TOKEN,
+    TWITTER_ACCESS_TOKEN_SECRET,
+    YDL_OPTS,
+    load_processed_videos,
+    save_processed_video,
+    get_latest_shorts,
+    download_video,
+    upload_to_twitter,
+    log,
+    setup_logging,
+)
+
+def run_check(youtube, client_v2, api_v1, processed):
     """
     Performs a single check for new videos and processes them.
     """
     try:
-        new_videos = get_latest_shorts(youtube, YOUTUBE_CHANNEL_ID)
+        new_videos = get_latest_shorts(youtube, YOUTUBE_CHANNEL_ID, processed)
         
         # Reverse order to post oldest new video first if multiple
         for video in reversed(new_videos):
             # Test Run Safety: Only process 1 video
-            if video["id"] in processed:
-                continue
-                
-            print(f"Found new video: {video['title']} ({video['id']})")
+            log.info("Found new video: %s (%s)", video["title"], video["id"])
             
             # Download
-            file_path = download_video(video["id"])
+            with yt_dlp.YoutubeDL(YDL_OPTS) as ydl:
+                video_file = download_video(video["id"], ydl)
             
-            if file_path:
+            if video_file:
                 # Construct Tweet Text with Description
                 tweet_text = f"{video['title']}\n\n{video['description']}"
                 
@@ -204,40 +46,35 @@ def run_check(youtube, client_v2, auth_v1, processed):
                 if len(tweet_text) > 4000:
                     tweet_text = tweet_text[:3997] + "..."
 
-                # Upload
-                success = upload_to_twitter(file_path, tweet_text, client_v2, auth_v1)
-                
-                # Cleanup CRITICAL STEP
-                if os.path.exists(file_path):
-                    try:
-                        os.remove(file_path)
-                        print(f"Deleted local file: {file_path}")
-                    except OSError as e:
-                        print(f"Error checking file after deletion: {e}")
+                # Upload (the local file is deleted when the block exits)
+                with video_file as file_path:
+                    success = upload_to_twitter(file_path, tweet_text, client_v2, api_v1)
                 
                 if success:
                     save_processed_video(video["id"], processed)
-                    print(f"Processed {video['id']}.")
-                    print("Test run: Stopping after 1 success.")
+                    log.info("Processed %s.", video["id"])
+                    log.info("Test run: Stopping after 1 success.")
                     return # Stop after 1 success
                 else:
-                    print(f"Failed to upload {video['id']}. Will try again next run.")
+                    log.warning("Failed to upload %s. Will try again next run.", video["id"])
             
             # If we attempted but failed (e.g. download failed), should we stop or try next?
             # For test run, let's stop after one ATTEMPT (successful or not regarding API logic, but download failure means we continue)
-            if file_path:
+            if video_file:
                  return # Stop if we got a file and tried to upload
             
             # If download returned None (failed download), loop continues to try next video in list
                     
     except Exception as e:
-        print(f"Error during check cycle: {e}")
+        log.error("Error during check cycle: %s", e)
 
 def main():
+    setup_logging()
+
     # 1. Validate Env Vars
     if not all([YOUTUBE_API_KEY, YOUTUBE_CHANNEL_ID, TWITTER_CONSUMER_KEY, 
                 TWITTER_CONSUMER_SECRET, TWITTER_ACCESS_TOKEN, TWITTER_ACCESS_TOKEN_SECRET]):
-        print("Error: Missing environment variables. Please check your configuration.")
+        log.error("Missing environment variables. Please check your configuration.")
         sys.exit(1)
 
     # 2. Setup Clients
@@ -246,12 +83,12 @@ def main():
     try:
         import pytz
     except ImportError:
-        print("Error: pytz module is missing. Please run 'pip install pytz'")
+        log.error("pytz module is missing. Please run 'pip install pytz'")
         sys.exit(1)
 
-    print("Starting YouTube Monitor (Daily 10:00 - 19:00 TR time)...")
+    log.info("Starting YouTube Monitor (Daily 10:00 - 19:00 TR time)...")
     
-    youtube = googleapiclient.discovery.build("youtube", "v3", developerKey=YOUTUBE_API_KEY)
+    youtube = googleapiclient.discovery.build("youtube", "v3", developerKey=YOUTUBE_API_KEY, static_discovery=True)
     
     client_v2 = tweepy.Client(
         consumer_key=TWITTER_CONSUMER_KEY,
@@ -264,22 +101,23 @@ def main():
         TWITTER_CONSUMER_KEY, TWITTER_CONSUMER_SECRET,
         TWITTER_ACCESS_TOKEN, TWITTER_ACCESS_TOKEN_SECRET
     )
+    api_v1 = tweepy.API(auth_v1)
 
     tz_tr = pytz.timezone("Europe/Istanbul")
 
     # Debug: Print loaded keys (masked) to verify
-    print(f"TWITTER_CONSUMER_KEY: {TWITTER_CONSUMER_KEY[:5]}...")
-    print(f"TWITTER_CONSUMER_SECRET: {TWITTER_CONSUMER_SECRET[:5]}...")
-    print(f"TWITTER_ACCESS_TOKEN: {TWITTER_ACCESS_TOKEN[:5]}...")
-    print(f"TWITTER_ACCESS_TOKEN_SECRET: {TWITTER_ACCESS_TOKEN_SECRET[:5]}...")
+    log.info("TWITTER_CONSUMER_KEY: %s...", TWITTER_CONSUMER_KEY[:5])
+    log.info("TWITTER_CONSUMER_SECRET: %s...", TWITTER_CONSUMER_SECRET[:5])
+    log.info("TWITTER_ACCESS_TOKEN: %s...", TWITTER_ACCESS_TOKEN[:5])
+    log.info("TWITTER_ACCESS_TOKEN_SECRET: %s...", TWITTER_ACCESS_TOKEN_SECRET[:5])
 
     # Load state fresh each time to be safe
     processed = load_processed_videos()
     
     # Run the check logic once
-    run_check(youtube, client_v2, auth_v1, processed)
+    run_check(youtube, client_v2, api_v1, processed)
     
-    print("Test execution finished.")
+    log.info("Test execution finished.")
 
 if __name__ == "__main__":
     main()